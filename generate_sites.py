@@ -12,13 +12,32 @@ The command regenerates ``docs/`` from the current CSV content.
 
 from __future__ import annotations
 
-import csv
-import html
+import io
+import mmap
+import multiprocessing
+import os
 import re
+import string
 import unicodedata
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
 
+import jinja2
+from markupsafe import Markup, escape
+
+try:
+    import polars as pl
+except ImportError:  # fall back to pyarrow's C++ CSV parser
+    pl = None
+    import pyarrow.csv as pacsv
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+    import json
+
 
 ROOT = Path(__file__).parent
 DATA_FILE = ROOT / "google-2025-12-28.csv"
@@ -27,142 +46,223 @@ DOCS_DIR = ROOT / "docs"
 ASSETS_DIR = DOCS_DIR / "assets"
 
 
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_DASH_SUB = re.compile(r"-+").sub
+
+
 def slugify(name: str) -> str:
-    """Create a URL-friendly slug while keeping non-Latin characters."""
+    """Create a URL-friendly slug while keeping CJK characters."""
+
+    normalized = unicodedata.normalize("NFKC", name).lower()
+    mapped = "".join(
+        c if c in _SLUG_KEEP or 0x4E00 <= ord(c) <= 0x9FFF else "-" for c in normalized
+    )
+    return _SLUG_DASH_SUB("-", mapped).strip("-")
 
-    normalized = unicodedata.normalize("NFKC", name).strip()
-    normalized = re.sub(r"[^\w\s-]", "", normalized)
-    normalized = re.sub(r"[-\s]+", "-", normalized)
-    return normalized.strip("-")
+
+_CLEAN_COLUMNS = ("UY7F9", "W4Efsd (4)", "W4Efsd (5)", "UsdlK", "ah5Ghc", "M4A5Cf", "ah5Ghc (2)")
 
 
 def clean_field(value: str) -> str:
     return value.replace("⋅", "").replace("·", "").strip()
 
 
+def _mmap_bytes(path: Path) -> bytes:
+    """Read ``path`` through a memory mapping instead of buffered reads."""
+
+    with path.open("rb") as raw_fp, mmap.mmap(raw_fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return bytes(mm)
+
+
+def _read_rows(path: Path) -> List[Dict[str, str]]:
+    """Parse ``path`` with pyarrow and return all-string rows."""
+
+    table = pacsv.read_csv(io.BytesIO(_mmap_bytes(path)))
+    return [
+        {key: ("" if value is None else str(value)) for key, value in row.items()}
+        for row in table.to_pylist()
+    ]
+
+
 def load_images() -> Dict[str, str]:
-    image_map: Dict[str, str] = {}
-    with DETAIL_FILE.open(encoding="utf-8") as detail_fp:
-        reader = csv.reader(detail_fp)
-        header = next(reader, [])
-        for row in reader:
-            if len(row) < 2:
-                continue
-            link, image = row[0].strip(), row[1].strip()
-            if link:
-                image_map[link] = image
-    return image_map
-
-
-def load_shops() -> List[dict]:
-    with DATA_FILE.open(encoding="utf-8") as data_fp:
-        reader = csv.reader(data_fp)
-        header = next(reader, [])
-        rows = list(reader)
+    if pl is None:
+        return {
+            link: row.get("aoRNLd src", "").strip()
+            for row in _read_rows(DETAIL_FILE)
+            if (link := row.get("hfpxzc href", "").strip())
+        }
+
+    df = (
+        pl.read_csv(
+            DETAIL_FILE,
+            encoding="utf8",
+            infer_schema_length=0,
+            empty_string_is_null=False,
+        )
+        .select(
+            pl.col("hfpxzc href").str.strip_chars(),
+            pl.col("aoRNLd src").str.strip_chars(),
+        )
+        .filter(pl.col("hfpxzc href") != "")
+    )
+    return dict(zip(df["hfpxzc href"], df["aoRNLd src"]))
+
+
+_ESCAPED_FIELDS = (
+    "name",
+    "display_name",
+    "map_url",
+    "rating",
+    "reviews",
+    "category",
+    "address",
+    "status",
+    "opening",
+    "website",
+    "phone",
+    "image",
+)
+
+
+@dataclass(slots=True)
+class Shop:
+    name: str
+    display_name: str
+    slug: str
+    map_url: str
+    rating: str
+    reviews: str
+    category: str
+    address: str
+    status: str
+    opening: str
+    website: str
+    phone: str
+    options: List[str]
+    image: str
+    name_esc: Markup
+    display_name_esc: Markup
+    map_url_esc: Markup
+    rating_esc: Markup
+    reviews_esc: Markup
+    category_esc: Markup
+    address_esc: Markup
+    status_esc: Markup
+    opening_esc: Markup
+    website_esc: Markup
+    phone_esc: Markup
+    image_esc: Markup
+    options_esc: List[Markup]
+
+
+def load_shops() -> List[Shop]:
+    if pl is not None:
+        records = (
+            pl.read_csv(
+                _mmap_bytes(DATA_FILE),
+                encoding="utf8",
+                infer_schema_length=0,
+                empty_string_is_null=False,
+            )
+            .with_columns(pl.all().str.strip_chars())
+            .with_columns(
+                pl.col(_CLEAN_COLUMNS)
+                .str.replace_all("⋅", "", literal=True)
+                .str.replace_all("·", "", literal=True)
+                .str.strip_chars()
+            )
+            .with_columns(pl.col("UY7F9").str.strip_chars("()"))
+            .to_dicts()
+        )
+    else:
+        records = [
+            {
+                key: (
+                    clean_field(value).strip("()")
+                    if key == "UY7F9"
+                    else clean_field(value)
+                    if key in _CLEAN_COLUMNS
+                    else value.strip()
+                )
+                for key, value in row.items()
+            }
+            for row in _read_rows(DATA_FILE)
+        ]
 
     image_map = load_images()
-    shops: List[dict] = []
-    used_slugs: set[str] = set()
+    prepared: List[dict] = []
+    bases: List[str] = []
 
-    for row in rows:
-        if not row or len(row) < 3:
-            continue
-
-        record = {header[idx]: (row[idx].strip() if idx < len(row) else "") for idx in range(len(header))}
+    for record in records:
         map_url = record.get("hfpxzc href", "")
         name = record.get("qBF1Pd", "")
         if not map_url or not name:
             continue
 
         rating = record.get("MW4etd", "")
-        reviews = clean_field(record.get("UY7F9", "").strip("()"))
+        reviews = record.get("UY7F9", "")
         category = record.get("W4Efsd", "")
         address = record.get("W4Efsd (3)", "")
-        status = clean_field(record.get("W4Efsd (4)", ""))
-        opening = clean_field(record.get("W4Efsd (5)", ""))
+        status = record.get("W4Efsd (4)", "")
+        opening = record.get("W4Efsd (5)", "")
         website = record.get("lcr4fd href", "")
-        phone = clean_field(record.get("UsdlK", ""))
+        phone = record.get("UsdlK", "")
 
         options = []
         for key in ("ah5Ghc", "M4A5Cf", "ah5Ghc (2)"):
-            value = clean_field(record.get(key, ""))
+            value = record.get(key, "")
             if value:
                 options.append(value)
 
-        slug_base = slugify(name) or "shop"
-        slug = slug_base
-        counter = 2
-        while slug in used_slugs:
-            slug = f"{slug_base}-{counter}"
-            counter += 1
-        used_slugs.add(slug)
-
-        shops.append(
-            {
-                "name": name,
-                "slug": slug,
-                "map_url": map_url,
-                "rating": rating,
-                "reviews": reviews,
-                "category": category,
-                "address": address,
-                "status": status,
-                "opening": opening,
-                "website": website,
-                "phone": phone,
-                "options": options,
-                "image": image_map.get(map_url, ""),
-            }
-        )
+        bases.append(slugify(name) or "shop")
+        fields = {
+            "name": name,
+            "display_name": name.rstrip("|｜ ") or name,
+            "map_url": map_url,
+            "rating": rating,
+            "reviews": reviews,
+            "category": category,
+            "address": address,
+            "status": status,
+            "opening": opening,
+            "website": website,
+            "phone": phone,
+            "options": options,
+            "image": image_map.get(map_url, ""),
+        }
+        for key in _ESCAPED_FIELDS:
+            fields[key + "_esc"] = escape(fields[key])
+        fields["options_esc"] = [escape(option) for option in options]
+        prepared.append(fields)
+
+    shops: List[Shop] = []
+    seen: Dict[str, int] = {}
+    for fields, base in zip(prepared, bases):
+        index = seen.get(base, 0)
+        seen[base] = index + 1
+        fields["slug"] = base if index == 0 else f"{base}-{index + 1}"
+        shops.append(Shop(**fields))
 
     return shops
 
 
-def render_shop_page(shop: dict) -> str:
-    image_section = (
-        f'<div class="hero" style="background-image: url({html.escape(shop["image"])});"></div>'
-        if shop.get("image")
-        else "<div class=\"hero placeholder\">本店家尚未提供照片</div>"
-    )
-
-    options_list = "".join(f"<li>{html.escape(option)}</li>" for option in shop.get("options", []))
-    options_block = (
-        f"<section><h2>服務選項</h2><ul class=\"pill-list\">{options_list}</ul></section>" if options_list else ""
-    )
-
-    details = []
-    for label, key in (
-        ("評分", "rating"),
-        ("評論數", "reviews"),
-        ("分類", "category"),
-        ("地址", "address"),
-        ("電話", "phone"),
-        ("營業資訊", "opening"),
-        ("目前狀態", "status"),
-    ):
-        value = shop.get(key, "")
-        if value:
-            details.append(f"<li><span class=\"label\">{label}</span><span class=\"value\">{html.escape(value)}</span></li>")
-
-    website_link = (
-        f"<a class=\"button secondary\" href=\"{html.escape(shop['website'])}\" target=\"_blank\" rel=\"noopener noreferrer\">官方網站</a>"
-        if shop.get("website")
-        else ""
-    )
+_DETAIL_FIELDS = (
+    ("評分", "rating_esc"),
+    ("評論數", "reviews_esc"),
+    ("分類", "category_esc"),
+    ("地址", "address_esc"),
+    ("電話", "phone_esc"),
+    ("營業資訊", "opening_esc"),
+    ("目前狀態", "status_esc"),
+)
 
-    map_link = (
-        f"<a class=\"button\" href=\"{html.escape(shop['map_url'])}\" target=\"_blank\" rel=\"noopener noreferrer\">在地圖上查看</a>"
-        if shop.get("map_url")
-        else ""
-    )
-
-    return f"""
+_SHOP_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="zh-Hant">
 <head>
   <meta charset="UTF-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{html.escape(shop['name'])} ｜ 寵物美容</title>
+  <title>{{ shop.display_name_esc }} ｜ 寵物美容</title>
   <link rel="preconnect" href="https://fonts.googleapis.com">
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+TC:wght@400;500;700&display=swap" rel="stylesheet">
@@ -172,26 +272,27 @@ def render_shop_page(shop: dict) -> str:
   <header class="page-header">
     <div>
       <a class="back-link" href="../../index.html">← 返回所有店家</a>
-      <h1>{html.escape(shop['name'])}</h1>
+      <h1>{{ shop.display_name_esc }}</h1>
       <p class="subtitle">為您找到最適合的寵物美容夥伴</p>
     </div>
     <div class="cta-group">
-      {map_link}
-      {website_link}
+      {% if shop.map_url %}<a class="button" href="{{ shop.map_url_esc }}" target="_blank" rel="noopener noreferrer">在地圖上查看</a>{% endif %}
+      {% if shop.website %}<a class="button secondary" href="{{ shop.website_esc }}" target="_blank" rel="noopener noreferrer">官方網站</a>{% endif %}
     </div>
   </header>
 
-  {image_section}
+  {% if shop.image %}<div class="hero" style="background-image: url({{ shop.image_esc }});"></div>{% else %}<div class="hero placeholder">本店家尚未提供照片</div>{% endif %}
 
   <main class="content">
     <section class="card">
       <h2>店家資訊</h2>
       <ul class="details">
-        {''.join(details)}
+        {% for label, value in details %}<li><span class="label">{{ label }}</span><span class="value">{{ value }}</span></li>
+        {% endfor %}
       </ul>
     </section>
 
-    {options_block}
+    {% if shop.options %}<section><h2>服務選項</h2><ul class="pill-list">{% for option in shop.options_esc %}<li>{{ option }}</li>{% endfor %}</ul></section>{% endif %}
   </main>
 
   <footer class="footer">資料來源：Google 地圖；圖片來源：店家公開照片。</footer>
@@ -199,25 +300,19 @@ def render_shop_page(shop: dict) -> str:
 </html>
 """
 
-
-def render_index(shops: List[dict]) -> str:
-    cards = []
-    for shop in shops:
-        image_style = f"style=\"background-image: url({html.escape(shop['image'])});\"" if shop.get("image") else ""
-        card = f"""
-      <a class="card shop-card" href="stores/{shop['slug']}/index.html">
-        <div class="thumb" {image_style}></div>
-        <div class="card-body">
-          <h2>{html.escape(shop['name'])}</h2>
-          <p class="meta">{html.escape(shop.get('category', ''))}</p>
-          <p class="meta">⭐ {html.escape(shop.get('rating', ''))}（{html.escape(shop.get('reviews', '0'))} 則評論）</p>
-          <p class="address">{html.escape(shop.get('address', ''))}</p>
-        </div>
-      </a>
+_CARD_TEMPLATE = """\
+<a class="card shop-card" href="stores/{{ shop.slug }}/index.html">
+      <div class="thumb" {% if shop.image %}style="background-image: url({{ shop.image_esc }});"{% endif %}></div>
+      <div class="card-body">
+        <h2>{{ shop.display_name_esc }}</h2>
+        <p class="meta">{{ shop.category_esc }}</p>
+        <p class="meta">⭐ {{ shop.rating_esc }}（{{ shop.reviews_esc or '0' }} 則評論）</p>
+        <p class="address">{{ shop.address_esc }}</p>
+      </div>
+    </a>
 """
-        cards.append(card)
 
-    return f"""
+_INDEX_PREFIX = """\
 <!DOCTYPE html>
 <html lang="zh-Hant">
 <head>
@@ -236,15 +331,71 @@ def render_index(shops: List[dict]) -> str:
       <h1>寵物美容店家專屬頁面</h1>
       <p class="subtitle">每間店家都擁有獨立介紹頁，讓飼主快速找到理想的美容夥伴。</p>
     </div>
-    <div class="pill">共 {len(shops)} 間店家</div>
+    <div class="pill">共 {count} 間店家</div>
   </header>
 
-  <main class="grid">{''.join(cards)}</main>
+  <main class="grid">
+    """
+
+_INDEX_SUFFIX = """
+  </main>
 
   <footer class="footer">資料來源：Google 地圖；圖片來源：店家公開照片。</footer>
 </body>
 </html>
-"""
+""".encode("utf-8")
+
+_ENV = jinja2.Environment(autoescape=True, auto_reload=False)
+_SHOP_TMPL = _ENV.from_string(_SHOP_TEMPLATE)
+_CARD_TMPL = _ENV.from_string(_CARD_TEMPLATE)
+
+
+def render_shop_page(shop: Shop) -> str:
+    details = [(label, value) for label, key in _DETAIL_FIELDS if (value := getattr(shop, key))]
+    return _SHOP_TMPL.render(shop=shop, details=details)
+
+
+def render_card(shop: Shop) -> str:
+    return _CARD_TMPL.render(shop=shop)
+
+
+def _write_shop_page(shop: Shop) -> None:
+    page_path = DOCS_DIR / "stores" / shop.slug / "index.html"
+    page_path.write_text(render_shop_page(shop), encoding="utf-8")
+
+
+_JSON_FIELDS = (
+    "name",
+    "display_name",
+    "slug",
+    "map_url",
+    "rating",
+    "reviews",
+    "category",
+    "address",
+    "status",
+    "opening",
+    "website",
+    "phone",
+    "options",
+    "image",
+)
+
+
+def write_json(shops: List[Shop]) -> None:
+    payload = [{key: getattr(shop, key) for key in _JSON_FIELDS} for shop in shops]
+    target = DOCS_DIR / "stores.json"
+    if orjson is not None:
+        target.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        target.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def write_index(cards: io.BytesIO, count: int) -> None:
+    with (DOCS_DIR / "index.html").open("wb") as index_fp:
+        index_fp.write(_INDEX_PREFIX.format(count=count).encode("utf-8"))
+        index_fp.write(cards.getbuffer())
+        index_fp.write(_INDEX_SUFFIX)
 
 
 def write_style() -> None:
@@ -326,23 +477,31 @@ a { color: inherit; text-decoration: none; }
   .details li { grid-template-columns: 1fr; }
 }
 """
-    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
     (ASSETS_DIR / "style.css").write_text(style, encoding="utf-8")
 
 
 def write_site() -> None:
     shops = load_shops()
-    shops.sort(key=lambda item: item["name"])
+    shops.sort(key=lambda item: item.name)
 
     write_style()
 
-    DOCS_DIR.mkdir(exist_ok=True)
-    (DOCS_DIR / "index.html").write_text(render_index(shops), encoding="utf-8")
+    stores_dir = DOCS_DIR / "stores"
+    stores_dir.mkdir(exist_ok=True)
+    existing_dirs = {entry.name for entry in os.scandir(stores_dir) if entry.is_dir()}
 
+    cards = io.BytesIO()
     for shop in shops:
-        shop_dir = DOCS_DIR / "stores" / shop["slug"]
-        shop_dir.mkdir(parents=True, exist_ok=True)
-        (shop_dir / "index.html").write_text(render_shop_page(shop), encoding="utf-8")
+        cards.write(render_card(shop).encode("utf-8"))
+        if shop.slug not in existing_dirs:
+            (stores_dir / shop.slug).mkdir()
+            existing_dirs.add(shop.slug)
+
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        pool.map(_write_shop_page, shops, chunksize=16)
+
+    write_index(cards, len(shops))
+    write_json(shops)
 
 
 if __name__ == "__main__":